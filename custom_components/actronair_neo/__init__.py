@@ -130,7 +130,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     await coordinator.async_config_entry_first_refresh()
-    await coordinator.async_refresh()
+
+    # Cancel scheduled and debounced refreshes when the entry is unloaded
+    entry.async_on_unload(coordinator.async_shutdown)
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
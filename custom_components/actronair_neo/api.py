@@ -3,11 +3,13 @@
 import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Any, Callable
 from datetime import datetime, timedelta
 import os
+import time
 import aiohttp # type: ignore
 import aiofiles # type: ignore
+import orjson # type: ignore
 
 from .const import (
     API_URL,
@@ -17,6 +19,7 @@ from .const import (
     MAX_TEMP,
     MAX_ZONES,
     MIN_TEMP,
+    STATUS_CACHE_TTL,
     BASE_FAN_MODES,
     ADVANCE_FAN_MODES,
     ADVANCE_SERIES_MODELS,
@@ -24,6 +27,98 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Request limits
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=API_TIMEOUT)
+ERROR_BODY_LIMIT = 1024  # bytes of an error response kept for logging
+
+# API endpoints
+USER_DEVICES_URL = f"{API_URL}/api/v0/client/user-devices"
+TOKEN_URL = f"{API_URL}/api/v0/oauth/token"
+AC_SYSTEMS_URL = f"{API_URL}/api/v0/client/ac-systems?includeNeo=true"
+STATUS_URL_TEMPLATE = f"{API_URL}/api/v0/client/ac-systems/status/latest?serial={{serial}}"
+COMMAND_URL_TEMPLATE = f"{API_URL}/api/v0/client/ac-systems/cmds/send?serial={{serial}}"
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Command body builders by command type
+COMMAND_BUILDERS: dict[str, Callable[..., dict[str, Any]]] = {
+    "ON": lambda: {
+        "command": {
+            "UserAirconSettings.isOn": True,
+            "type": "set-settings"
+        }
+    },
+    "OFF": lambda: {
+        "command": {
+            "UserAirconSettings.isOn": False,
+            "type": "set-settings"
+        }
+    },
+    "CLIMATE_MODE": lambda mode: {
+        "command": {
+            "UserAirconSettings.isOn": True,
+            "UserAirconSettings.Mode": mode,
+            "type": "set-settings"
+        }
+    },
+    "FAN_MODE": lambda mode: {
+        "command": {
+            "UserAirconSettings.FanMode": mode,
+            "type": "set-settings"
+        }
+    },
+    "SET_TEMP": lambda temp, is_cool: {
+        "command": {
+            f"UserAirconSettings.TemperatureSetpoint_{'Cool' if is_cool else 'Heat'}_oC": temp,
+            "type": "set-settings"
+        }
+    },
+    "AWAY_MODE": lambda state: {
+        "command": {
+            "UserAirconSettings.AwayMode": state,
+            "type": "set-settings"
+        }
+    },
+    "QUIET_MODE": lambda state: {
+        "command": {
+            "UserAirconSettings.QuietMode": state,
+            "type": "set-settings"
+        }
+    },
+    "SET_ZONE_TEMP": lambda zone, temp, temp_key: {
+        "command": {
+            f"RemoteZoneInfo[{zone}].{temp_key}": temp,
+            "type": "set-settings"
+        }
+    },
+    "SET_ZONE_TEMPS": lambda zone, temps: {
+        "command": {
+            **{f"RemoteZoneInfo[{zone}].{key}": temp for key, temp in temps.items()},
+            "type": "set-settings"
+        }
+    },
+    "SET_ZONE_STATE": lambda zones: {
+        "command": {
+            "UserAirconSettings.EnabledZones": zones,
+            "type": "set-settings"
+        }
+    },
+}
+
+# Commands without parameters, serialized once and keyed by their settings
+STATIC_COMMANDS: dict[tuple, bytes] = {
+    tuple(command["command"].items()): orjson.dumps(command)
+    for command in (COMMAND_BUILDERS["ON"](), COMMAND_BUILDERS["OFF"]())
+}
+
+def _encode_command(command: dict[str, Any]) -> bytes:
+    """Serialize a command, reusing the pre-encoded body for static commands."""
+    try:
+        return STATIC_COMMANDS[tuple(command["command"].items())]
+    except (KeyError, TypeError):
+        # Not a static command, or it carries unhashable values such as zone lists
+        return orjson.dumps(command)
+
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
 
@@ -76,11 +171,11 @@ class ActronApi:
         Args:
             username: ActronAir Neo account username
             password: ActronAir Neo account password
-            session: aiohttp client session for API requests
-            config_path: Path to store configuration files
+            session: Home Assistant's shared aiohttp client session
         Note:
             The class manages API authentication, rate limiting, and maintains
-            state for the ActronAir Neo system including fan modes.
+            state for the ActronAir Neo system including fan modes. The session
+            is owned by Home Assistant, so the API never creates or closes one.
         """
         # Authentication credentials
         self.username = username
@@ -89,9 +184,9 @@ class ActronApi:
 
         # Token management
         self.token_file = os.path.join('/config', "actron_token.json")  # Use HA config dir
-        self.refresh_token_value: Optional[str] = None
-        self.access_token: Optional[str] = None
-        self.token_expires_at: Optional[datetime] = None
+        self.refresh_token_value: str | None = None
+        self.access_token: str | None = None
+        self.token_expires_at: datetime | None = None
 
         # Device identification
         self.actron_serial: str = ''
@@ -99,8 +194,19 @@ class ActronApi:
 
         # API health tracking
         self.error_count: int = 0
-        self.last_successful_request: Optional[datetime] = None
-        self.cached_status: Optional[dict] = None
+        self.last_successful_request: datetime | None = None
+        self.cached_status: dict | None = None
+
+        # Single-flight status fetching: concurrent callers share one request
+        self._status_lock = asyncio.Lock()
+        self._status_fetched_at: dict[str, float] = {}
+
+        # Per-serial endpoint URLs, built on first use
+        self._status_urls: dict[str, str] = {}
+        self._command_urls: dict[str, str] = {}
+
+        # ETags of cacheable responses, used for conditional requests
+        self._etags: dict[str, str] = {}
 
         # Rate limiting
         self.rate_limiter = RateLimiter(MAX_REQUESTS_PER_MINUTE)
@@ -113,12 +219,12 @@ class ActronApi:
 
         # Fan mode management
         self._continuous_fan: bool = False
-        self._last_fan_mode_change: Optional[datetime] = None
+        self._last_fan_mode_change: datetime | None = None
         self._fan_mode_change_lock: asyncio.Lock = asyncio.Lock()
         self._min_fan_mode_interval: int = 5  # Minimum seconds between fan mode changes
 
         # Zone locks
-        self._zone_locks: Dict[int, asyncio.Lock] = {}
+        self._zone_locks: dict[int, asyncio.Lock] = {}
 
         # Request tracking
         self._request_timestamps: list[datetime] = []
@@ -262,7 +368,7 @@ class ActronApi:
 
     async def _get_refresh_token(self):
         """Get the refresh token."""
-        url = f"{API_URL}/api/v0/client/user-devices"
+        url = USER_DEVICES_URL
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         data = {
             "username": self.username,
@@ -287,7 +393,7 @@ class ActronApi:
 
     async def _get_access_token(self):
         """Get access token using refresh token."""
-        url = f"{API_URL}/api/v0/oauth/token"
+        url = TOKEN_URL
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         data = {
             "grant_type": "refresh_token",
@@ -358,13 +464,22 @@ class ActronApi:
         raise AuthenticationError("Failed to refresh token and re-authentication failed")
 
     async def _make_request(
-        self, method: str, url: str, auth_required: bool = True, **kwargs
-    ) -> Dict[str, Any]:
-        """Make an API request with rate limiting and error handling."""
+        self,
+        method: str,
+        url: str,
+        auth_required: bool = True,
+        etag_key: str | None = None,
+        **kwargs
+    ) -> dict[str, Any] | None:
+        """Make an API request with rate limiting and error handling.
+
+        When etag_key is given, the response ETag is remembered under that key
+        and a 304 Not Modified response is returned as None.
+        """
         async with self.rate_limiter:
             for attempt in range(MAX_RETRIES):
                 try:
-                    headers = kwargs.get('headers', {})
+                    headers = dict(kwargs.get('headers') or {})
                     if auth_required:
                         async with self._refresh_lock:
                             if not self.access_token or datetime.now() >= self.token_expires_at:
@@ -374,29 +489,33 @@ class ActronApi:
 
                     # Log request details
                     _LOGGER.debug("Making %s request to: %s", method, url)
-                    if 'json' in kwargs and kwargs['json'] is not None:
+                    if kwargs.get('json') is not None and _LOGGER.isEnabledFor(logging.DEBUG):
                         _LOGGER.debug("Request payload:\n%s", json.dumps(kwargs['json'], indent=2))
 
                     async with self.session.request(
-                        method, url, timeout=API_TIMEOUT, **kwargs
+                        method, url, timeout=REQUEST_TIMEOUT, **kwargs
                     ) as response:
-                        response_text = await response.text()
                         _LOGGER.debug("Response status: %s", response.status)
-                        try:
-                            response_json = json.loads(response_text)
-                            _LOGGER.debug("Response body:\n%s", json.dumps(response_json, indent=2))
-                        except json.JSONDecodeError:
-                            _LOGGER.debug("Non-JSON response body:\n%s", response_text)
 
-                        if response.status == 200:
+                        if response.status == 304 and etag_key is not None:
                             self.error_count = 0
                             self.last_successful_request = datetime.now()
-                            return response_json if 'response_json' in locals() else response_text
-                        elif response.status == 401 and auth_required:
+                            return None
+
+                        if response.status == 401 and auth_required:
                             _LOGGER.warning("Token expired, refreshing...")
                             await self.refresh_access_token()
                             continue
-                        else:
+
+                        if response.status != 200:
+                            # The body is only used for the error message, so bound the read
+                            try:
+                                chunk = await response.content.readexactly(ERROR_BODY_LIMIT)
+                            except asyncio.IncompleteReadError as err:
+                                chunk = err.partial
+                            response_text = chunk.decode("utf-8", "replace")
+                            if not response.content.at_eof():
+                                response_text += "..."
                             _LOGGER.error(
                                 "API request failed: %s, %s", response.status, response_text
                             )
@@ -406,6 +525,27 @@ class ActronApi:
                                 status_code=response.status
                             )
 
+                        # The API always returns UTF-8 JSON, so skip charset detection
+                        body = await response.read()
+                        try:
+                            response_data = orjson.loads(body)
+                            if _LOGGER.isEnabledFor(logging.DEBUG):
+                                _LOGGER.debug(
+                                    "Response body:\n%s", json.dumps(response_data, indent=2)
+                                )
+                        except orjson.JSONDecodeError:
+                            response_data = body.decode("utf-8", "replace")
+                            _LOGGER.debug("Non-JSON response body:\n%s", response_data)
+
+                        self.error_count = 0
+                        self.last_successful_request = datetime.now()
+                        if etag_key is not None:
+                            if etag := response.headers.get("ETag"):
+                                self._etags[etag_key] = etag
+                            else:
+                                self._etags.pop(etag_key, None)
+                        return response_data
+
                 except (aiohttp.ClientError, asyncio.TimeoutError) as err:
                     _LOGGER.error("Request error on attempt %s: %s", attempt + 1, err)
                     self.error_count += 1
@@ -426,9 +566,9 @@ class ActronApi:
                 return False
         return True
 
-    async def get_devices(self) -> List[Dict[str, str]]:
+    async def get_devices(self) -> list[dict[str, str]]:
         """Fetch the list of devices from the API."""
-        url = f"{API_URL}/api/v0/client/ac-systems?includeNeo=true"
+        url = AC_SYSTEMS_URL
         _LOGGER.debug("Fetching devices from: %s", url)
         response = await self._make_request("GET", url)
         _LOGGER.debug("Get devices response: %s", response)
@@ -443,29 +583,60 @@ class ActronApi:
         _LOGGER.debug("Found devices: %s", devices)
         return devices
 
-    async def get_ac_status(self, serial: str) -> Dict[str, Any]:
+    async def get_ac_status(self, serial: str) -> dict[str, Any]:
         """Get the current status of the AC system."""
         if not self.is_api_healthy():
             _LOGGER.warning("API is not healthy, using cached status")
             return self.cached_status if self.cached_status else {}
 
-        url = f"{API_URL}/api/v0/client/ac-systems/status/latest?serial={serial}"
-        _LOGGER.debug("Fetching AC status from: %s", url)
-        response = await self._make_request("GET", url)
-        _LOGGER.debug("AC status response: %s", response)
-        self.cached_status = response
-        return response
-
-    async def send_command(self, serial: str, command: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._status_lock:
+            # Reuse a status fetched moments ago, e.g. by a concurrent caller
+            fetched_at = self._status_fetched_at.get(serial)
+            if (
+                fetched_at is not None
+                and self.cached_status is not None
+                and time.monotonic() - fetched_at < STATUS_CACHE_TTL
+            ):
+                _LOGGER.debug("Using AC status fetched %.2fs ago", time.monotonic() - fetched_at)
+                return self.cached_status
+
+            url = self._status_urls.get(serial)
+            if url is None:
+                url = self._status_urls[serial] = STATUS_URL_TEMPLATE.format(serial=serial)
+            _LOGGER.debug("Fetching AC status from: %s", url)
+            headers = {}
+            etag = self._etags.get(serial)
+            if etag and self.cached_status is not None:
+                headers["If-None-Match"] = etag
+            response = await self._make_request("GET", url, etag_key=serial, headers=headers)
+            self._status_fetched_at[serial] = time.monotonic()
+            if response is None:
+                _LOGGER.debug("AC status not modified, using cached status")
+                return self.cached_status
+            _LOGGER.debug("AC status response: %s", response)
+            self.cached_status = response
+            return response
+
+    async def send_command(self, serial: str, command: dict[str, Any]) -> dict[str, Any]:
         """Send a command to the AC system."""
-        url = f"{API_URL}/api/v0/client/ac-systems/cmds/send?serial={serial}"
+        url = self._command_urls.get(serial)
+        if url is None:
+            url = self._command_urls[serial] = COMMAND_URL_TEMPLATE.format(serial=serial)
+        # Serialize once; retries reuse the same body
+        payload = _encode_command(command)
         _LOGGER.debug("Sending command to: %s", url)
-        _LOGGER.debug("Command payload:\n%s", json.dumps(command, indent=2))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Command payload:\n%s", json.dumps(command, indent=2))
 
         for attempt in range(MAX_RETRIES):
             try:
-                response = await self._make_request("POST", url, json=command)
-                _LOGGER.debug("Command response:\n%s", json.dumps(response, indent=2))
+                response = await self._make_request(
+                    "POST", url, data=payload, headers=JSON_HEADERS
+                )
+                # The next status read must reflect this command
+                self._status_fetched_at.pop(serial, None)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Command response:\n%s", json.dumps(response, indent=2))
                 return response
             except ApiError as e:
                 if (attempt < MAX_RETRIES - 1) and (e.status_code in [500, 502, 503, 504]):
@@ -485,7 +656,7 @@ class ActronApi:
 
         raise ApiError(f"Failed to send command after {MAX_RETRIES} attempts")
 
-    async def get_zone_statuses(self) -> List[bool]:
+    async def get_zone_statuses(self) -> list[bool]:
         """Get the current status of all zones."""
         status = await self.get_ac_status(self.actron_serial)
         return status['lastKnownState']['UserAirconSettings']['EnabledZones']
@@ -498,7 +669,7 @@ class ActronApi:
         command = self.create_command("SET_ZONE_STATE", zones=modified_statuses)
         await self.send_command(self.actron_serial, command)
 
-    def get_zone_capabilities(self, zone_data: Dict[str, Any]) -> Dict[str, Any]:
+    def get_zone_capabilities(self, zone_data: dict[str, Any]) -> dict[str, Any]:
         """Extract zone capabilities from zone data.
         
         Args:
@@ -525,11 +696,13 @@ class ActronApi:
     async def set_zone_temperature(
         self,
         zone_index: int,
-        temperature: Optional[float] = None,
-        target_cool: Optional[float] = None,
-        target_heat: Optional[float] = None
+        temperature: float | None = None,
+        target_cool: float | None = None,
+        target_heat: float | None = None
     ) -> None:
         """Set zone temperature with comprehensive validation and error handling.
+
+        All requested setpoints are sent to the API in a single command.
         
         Args:
             zone_index: Zero-based zone index
@@ -554,34 +727,20 @@ class ActronApi:
         async with self._zone_locks.setdefault(zone_index, asyncio.Lock()):
             if temperature is not None:
                 # Single target mode
-                command = self.create_command(
-                    "SET_ZONE_TEMP",
-                    zone=zone_index,
-                    temp=temperature,
-                    temp_key="TemperatureSetpoint_oC"
-                )
-            elif target_cool is not None and target_heat is not None:
-                # Separate targets mode
-                await self.send_command(
-                    self.actron_serial,
-                    self.create_command(
-                        "SET_ZONE_TEMP",
-                        zone=zone_index,
-                        temp=target_cool,
-                        temp_key="TemperatureSetpoint_Cool_oC"
-                    )
-                )
-                command = self.create_command(
-                    "SET_ZONE_TEMP",
-                    zone=zone_index,
-                    temp=target_heat,
-                    temp_key="TemperatureSetpoint_Heat_oC"
-                )
+                temps = {"TemperatureSetpoint_oC": temperature}
+            elif target_cool is not None or target_heat is not None:
+                # Separate targets mode, batched into one command
+                temps = {}
+                if target_cool is not None:
+                    temps["TemperatureSetpoint_Cool_oC"] = target_cool
+                if target_heat is not None:
+                    temps["TemperatureSetpoint_Heat_oC"] = target_heat
             else:
                 raise ValueError(
-                    "Must provide either temperature or both target_cool and target_heat"
+                    "Must provide either temperature or target_cool and/or target_heat"
                 )
 
+            command = self.create_command("SET_ZONE_TEMPS", zone=zone_index, temps=temps)
             await self.send_command(self.actron_serial, command)
 
     async def initializer(self):
@@ -616,73 +775,16 @@ class ActronApi:
         else:
             _LOGGER.error("Could not identify target device from list of returned systems")
 
-    def create_command(self, command_type: str, **params) -> Dict[str, Any]:
+    def create_command(self, command_type: str, **params) -> dict[str, Any]:
         """Create a command based on the command type and parameters."""
-        commands = {
-            "ON": lambda: {
-            "command": {
-                "UserAirconSettings.isOn": True,
-                "type": "set-settings"
-            }
-            },
-            "OFF": lambda: {
-            "command": {
-                "UserAirconSettings.isOn": False,
-                "type": "set-settings"
-            }
-            },
-            "CLIMATE_MODE": lambda mode: {
-            "command": {
-                "UserAirconSettings.isOn": True,
-                "UserAirconSettings.Mode": mode,
-                "type": "set-settings"
-            }
-            },
-            "FAN_MODE": lambda mode: {
-            "command": {
-                "UserAirconSettings.FanMode": mode,
-                "type": "set-settings"
-            }
-            },
-            "SET_TEMP": lambda temp, is_cool: {
-            "command": {
-                f"UserAirconSettings.TemperatureSetpoint_{'Cool' if is_cool else 'Heat'}_oC": temp,
-                "type": "set-settings"
-            }
-            },
-            "AWAY_MODE": lambda state: {
-            "command": {
-                "UserAirconSettings.AwayMode": state,
-                "type": "set-settings"
-            }
-            },
-            "QUIET_MODE": lambda state: {
-            "command": {
-                "UserAirconSettings.QuietMode": state,
-                "type": "set-settings"
-            }
-            },
-            "SET_ZONE_TEMP": lambda zone, temp, temp_key: {
-            "command": {
-                f"RemoteZoneInfo[{zone}].{temp_key}": temp,
-                "type": "set-settings"
-            }
-            },
-            "SET_ZONE_STATE": lambda zones: {
-            "command": {
-                "UserAirconSettings.EnabledZones": zones,
-                "type": "set-settings"
-            }
-            },
-        }
-        return commands[command_type](**params)
+        return COMMAND_BUILDERS[command_type](**params)
 
     async def set_climate_mode(self, mode: str) -> None:
         """Set the climate mode."""
         command = self.create_command("CLIMATE_MODE", mode=mode)
         await self.send_command(self.actron_serial, command)
 
-    async def set_fan_mode(self, mode: str, continuous: Optional[bool] = None) -> None:
+    async def set_fan_mode(self, mode: str, continuous: bool | None = None) -> None:
         """Set fan mode with state tracking, validation and retry logic.
 
         Args:
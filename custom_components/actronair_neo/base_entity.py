@@ -1,6 +1,8 @@
 """Base entity for ActronAir Neo integration."""
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.helpers.entity import EntityCategory # type: ignore
 from homeassistant.helpers.update_coordinator import CoordinatorEntity # type: ignore
 
@@ -44,16 +46,20 @@ class ActronEntityBase(CoordinatorEntity):
         # Set consistent name
         self._attr_name = name_suffix if name_suffix else self.DEVICE_NAME
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        coordinator_data = self.coordinator.data
+        # Device info is only read when the entity is registered
+        self._attr_device_info = self.build_device_info(coordinator)
+
+    @classmethod
+    def build_device_info(cls, coordinator: ActronDataCoordinator) -> dict[str, Any] | None:
+        """Build the device registry info from the coordinator's current data."""
+        coordinator_data = coordinator.data
         if isinstance(coordinator_data, dict):
+            main = coordinator_data.get("main", {})
             return {
-                "identifiers": {(DOMAIN, self.coordinator.device_id)},
-                "name": self.DEVICE_NAME,
+                "identifiers": {(DOMAIN, coordinator.device_id)},
+                "name": cls.DEVICE_NAME,
                 "manufacturer": "ActronAir",
-                "model": coordinator_data.get("main", {}).get("model"),
-                "sw_version": coordinator_data.get("main", {}).get("firmware_version"),
+                "model": main.get("model"),
+                "sw_version": main.get("firmware_version"),
             }
         return None
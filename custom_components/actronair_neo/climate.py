@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import Any
 import logging
+import math
 
 from homeassistant.components.climate import ( # type: ignore
     ClimateEntity,
@@ -20,7 +21,7 @@ from homeassistant.const import ( # type: ignore
     ATTR_TEMPERATURE,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant # type: ignore
+from homeassistant.core import HomeAssistant, callback # type: ignore
 from homeassistant.helpers.entity_platform import AddEntitiesCallback # type: ignore
 from homeassistant.helpers import entity_registry as er # type: ignore
 
@@ -30,6 +31,7 @@ from .const import (
     DOMAIN,
     MIN_TEMP,
     MAX_TEMP,
+    SETPOINT_TOLERANCE,
     BASE_FAN_MODES,
     BASE_FAN_MODE_ORDER,
     ADVANCE_FAN_MODES,
@@ -40,8 +42,9 @@ from .coordinator import ActronDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-HVAC_MODES = [HVACMode.OFF, HVACMode.COOL, HVACMode.HEAT, HVACMode.FAN_ONLY, HVACMode.AUTO]
-FAN_MODES = [FAN_LOW, FAN_MEDIUM, FAN_HIGH, FAN_AUTO]
+HVAC_MODES = (HVACMode.OFF, HVACMode.COOL, HVACMode.HEAT, HVACMode.FAN_ONLY, HVACMode.AUTO)
+FAN_MODES = (FAN_LOW, FAN_MEDIUM, FAN_HIGH, FAN_AUTO)
+DEFAULT_FAN_MODES = (FAN_LOW, FAN_MEDIUM, FAN_HIGH)
 
 FAN_MODE_MAP = {
     FAN_LOW: "LOW",
@@ -52,6 +55,29 @@ FAN_MODE_MAP = {
 
 REVERSE_FAN_MODE_MAP = {v: k for k, v in FAN_MODE_MAP.items()}
 
+HVAC_MODE_MAP = {
+    HVACMode.AUTO: "AUTO",
+    HVACMode.HEAT: "HEAT",
+    HVACMode.COOL: "COOL",
+    HVACMode.FAN_ONLY: "FAN",
+    HVACMode.OFF: "OFF",
+}
+
+REVERSE_HVAC_MODE_MAP = {v: k for k, v in HVAC_MODE_MAP.items()}
+
+ZONE_HVAC_MODES = (HVACMode.OFF, HVACMode.COOL, HVACMode.HEAT, HVACMode.AUTO)
+
+TARGET_SETPOINT_KEYS = {
+    HVACMode.COOL: "temp_setpoint_cool",
+    HVACMode.HEAT: "temp_setpoint_heat",
+}
+
+def _same_setpoint(current: float | None, requested: float) -> bool:
+    """Return True if the requested setpoint matches the current one."""
+    return current is not None and math.isclose(
+        current, requested, abs_tol=SETPOINT_TOLERANCE
+    )
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -73,7 +99,7 @@ async def async_setup_entry(
             if entry.unique_id.startswith(f"{coordinator.device_id}_zone_"):
                 entity_registry.async_remove(entry.entity_id)
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class ActronClimate(ActronEntityBase, ClimateEntity):
@@ -93,29 +119,30 @@ class ActronClimate(ActronEntityBase, ClimateEntity):
             | ClimateEntityFeature.TURN_ON
             | ClimateEntityFeature.TURN_OFF
         )
+        # Cached reference to the main unit data, refreshed once per update
+        self._main = coordinator.data["main"]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached data references before writing state."""
+        self._main = self.coordinator.data.get("main", self._main)
+        super()._handle_coordinator_update()
 
     @property
     def fan_modes(self) -> list[str]:
         """Return the list of available fan modes based on model capabilities."""
         try:
-            model = self.coordinator.data["main"].get("model")
-            supported_modes = self.coordinator.data["main"].get("supported_fan_modes", BASE_FAN_MODES)
+            model = self._main.get("model")
+            supported_modes = self._main.get("supported_fan_modes", BASE_FAN_MODES)
             if supported_modes == ADVANCE_FAN_MODES:
                 supported_modes = ADVANCED_FAN_MODE_ORDER
             elif supported_modes == BASE_FAN_MODES:
                 supported_modes = BASE_FAN_MODE_ORDER
             
             # Map Actron modes to HA modes
-            mode_map = {
-                "LOW": FAN_LOW,
-                "MED": FAN_MEDIUM,
-                "HIGH": FAN_HIGH,
-                "AUTO": FAN_AUTO
-            }
-            
             available_modes = []
             for mode in supported_modes:
-                if ha_mode := mode_map.get(mode):
+                if ha_mode := REVERSE_FAN_MODE_MAP.get(mode):
                     available_modes.append(ha_mode)
             
             _LOGGER.debug(
@@ -125,38 +152,36 @@ class ActronClimate(ActronEntityBase, ClimateEntity):
                 supported_modes
             )
             
-            return available_modes or [FAN_LOW, FAN_MEDIUM, FAN_HIGH]  # Fallback
+            return available_modes or list(DEFAULT_FAN_MODES)  # Fallback
             
         except Exception as err:
             _LOGGER.error("Error getting fan modes: %s", err, exc_info=True)
-            return [FAN_LOW, FAN_MEDIUM, FAN_HIGH]  # Safe fallback
+            return list(DEFAULT_FAN_MODES)  # Safe fallback
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self.coordinator.data["main"]["indoor_temp"]
+        return self._main["indoor_temp"]
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        if self.hvac_mode == HVACMode.COOL:
-            return self.coordinator.data["main"]["temp_setpoint_cool"]
-        elif self.hvac_mode == HVACMode.HEAT:
-            return self.coordinator.data["main"]["temp_setpoint_heat"]
+        if key := TARGET_SETPOINT_KEYS.get(self.hvac_mode):
+            return self._main[key]
         return None
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return hvac operation ie. heat, cool mode."""
-        if not self.coordinator.data["main"]["is_on"]:
+        main = self._main
+        if not main["is_on"]:
             return HVACMode.OFF
-        mode = self.coordinator.data["main"]["mode"]
-        return self._actron_to_ha_hvac_mode(mode)
+        return REVERSE_HVAC_MODE_MAP.get(main["mode"].upper(), HVACMode.OFF)
 
     @property
     def fan_mode(self) -> str | None:
         """Return the fan setting."""
-        actron_fan_mode = self.coordinator.data["main"]["fan_mode"]
+        actron_fan_mode = self._main["fan_mode"]
         # Remove +CONT suffix and get base mode
         base_mode = actron_fan_mode.split('+')[0] if actron_fan_mode else "LOW"
         base_mode = base_mode.split('-')[0] if '-' in base_mode else base_mode
@@ -165,7 +190,7 @@ class ActronClimate(ActronEntityBase, ClimateEntity):
     @property
     def current_humidity(self) -> int | None:
         """Return the current humidity."""
-        return self.coordinator.data["main"]["indoor_humidity"]
+        return self._main["indoor_humidity"]
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -173,6 +198,9 @@ class ActronClimate(ActronEntityBase, ClimateEntity):
         if temperature is None:
             return
         is_cooling = self.hvac_mode in [HVACMode.COOL, HVACMode.AUTO]
+        current = self._main["temp_setpoint_cool" if is_cooling else "temp_setpoint_heat"]
+        if _same_setpoint(current, temperature):
+            return  # No change needed
         await self.coordinator.set_temperature(temperature, is_cooling)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
@@ -186,6 +214,7 @@ class ActronClimate(ActronEntityBase, ClimateEntity):
             actron_mode = self._ha_to_actron_hvac_mode(hvac_mode)
             command = self.coordinator.api.create_command("CLIMATE_MODE", mode=actron_mode)
 
+        self.coordinator.mark_activity()
         await self.coordinator.api.send_command(self.coordinator.device_id, command)
         await self.coordinator.async_request_refresh()
 
@@ -194,6 +223,8 @@ class ActronClimate(ActronEntityBase, ClimateEntity):
         try:
             # Convert HA fan mode to Actron mode
             actron_mode = FAN_MODE_MAP.get(fan_mode, "LOW")
+            if actron_mode == self._main.get("base_fan_mode"):
+                return  # No change needed
             
             # Get current continuous state
             current_fan_mode = self.coordinator.data["main"]["fan_mode"]
@@ -237,6 +268,7 @@ class ActronClimate(ActronEntityBase, ClimateEntity):
             return  # Already on
 
         command = self.coordinator.api.create_command("ON")
+        self.coordinator.mark_activity()
         await self.coordinator.api.send_command(self.coordinator.device_id, command)
         await self.coordinator.async_request_refresh()
 
@@ -246,49 +278,26 @@ class ActronClimate(ActronEntityBase, ClimateEntity):
             return  # Already off
 
         command = self.coordinator.api.create_command("OFF")
+        self.coordinator.mark_activity()
         await self.coordinator.api.send_command(self.coordinator.device_id, command)
         await self.coordinator.async_request_refresh()
 
     def _actron_to_ha_hvac_mode(self, mode: str) -> HVACMode:
         """Convert Actron HVAC mode to HA HVAC mode."""
-        mode_map = {
-            "AUTO": HVACMode.AUTO,
-            "HEAT": HVACMode.HEAT,
-            "COOL": HVACMode.COOL,
-            "FAN": HVACMode.FAN_ONLY,
-            "OFF": HVACMode.OFF,
-        }
-        return mode_map.get(mode.upper(), HVACMode.OFF)
+        return REVERSE_HVAC_MODE_MAP.get(mode.upper(), HVACMode.OFF)
 
     def _ha_to_actron_hvac_mode(self, mode: HVACMode) -> str:
         """Convert HA HVAC mode to Actron HVAC mode."""
-        mode_map = {
-            HVACMode.AUTO: "AUTO",
-            HVACMode.HEAT: "HEAT",
-            HVACMode.COOL: "COOL",
-            HVACMode.FAN_ONLY: "FAN",
-            HVACMode.OFF: "OFF",
-        }
-        return mode_map.get(mode, "OFF")
-
-    @property
-    def device_info(self):
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.device_id)},
-            "name": self.name,
-            "manufacturer": "ActronAir",
-            "model": self.coordinator.data["main"]["model"],
-            "sw_version": self.coordinator.data["main"]["firmware_version"],
-        }
+        return HVAC_MODE_MAP.get(mode, "OFF")
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        actron_fan_mode = self.coordinator.data["main"]["fan_mode"]
+        main = self._main
+        actron_fan_mode = main["fan_mode"]
         return {
-            "away_mode": self.coordinator.data["main"]["away_mode"],
-            "quiet_mode": self.coordinator.data["main"]["quiet_mode"],
+            "away_mode": main["away_mode"],
+            "quiet_mode": main["quiet_mode"],
             "continuous_fan": "+CONT" in actron_fan_mode if actron_fan_mode else False,
             "base_fan_mode": actron_fan_mode.split('+')[0] if actron_fan_mode else "LOW"
         }
@@ -321,7 +330,7 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
 
         # Set up basic attributes
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
-        self._attr_hvac_modes = [HVACMode.OFF, HVACMode.COOL, HVACMode.HEAT, HVACMode.AUTO]
+        self._attr_hvac_modes = ZONE_HVAC_MODES
         self._attr_min_temp = MIN_TEMP
         self._attr_max_temp = MAX_TEMP
 
@@ -341,6 +350,18 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
 
         self._attr_supported_features = features
 
+        # Cached references to zone and main unit data, refreshed once per update
+        self._zone = zone_data
+        self._main = coordinator.data["main"]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached data references before writing state."""
+        data = self.coordinator.data
+        self._main = data.get("main", self._main)
+        self._zone = data.get("zones", {}).get(self.zone_id, self._zone)
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -356,17 +377,17 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
     def hvac_mode(self) -> HVACMode:
         """Return hvac operation ie. heat, cool mode."""
         # Return OFF if zone is disabled
-        if not self.coordinator.data['zones'][self.zone_id]['is_enabled']:
+        if not self._zone['is_enabled']:
             return HVACMode.OFF
 
         # Otherwise use main unit's mode
-        mode = self.coordinator.data["main"]["mode"]
+        mode = self._main["mode"]
         return self._actron_to_ha_hvac_mode(mode)
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self.coordinator.data['zones'][self.zone_id]['temp']
+        return self._zone['temp']
 
     @property
     def target_temperature(self) -> float | None:
@@ -374,8 +395,8 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
         if not self._has_temp_control:
             return None
 
-        zone_data = self.coordinator.data['zones'][self.zone_id]
-        main_mode = self.coordinator.data["main"]["mode"]
+        zone_data = self._zone
+        main_mode = self._main["mode"]
 
         try:
             if self._has_separate_targets:
@@ -385,7 +406,7 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
                     return zone_data["temp_setpoint_heat"]
                 elif main_mode == "AUTO":
                     # In auto mode, return based on current compressor state
-                    compressor_state = self.coordinator.data["main"]["compressor_state"]
+                    compressor_state = self._main["compressor_state"]
                     if compressor_state == "COOL":
                         return zone_data["temp_setpoint_cool"]
                     elif compressor_state == "HEAT":
@@ -406,7 +427,7 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
         if not (self._has_temp_control and self._has_separate_targets):
             return None
 
-        return self.coordinator.data['zones'][self.zone_id]["temp_setpoint_cool"]
+        return self._zone["temp_setpoint_cool"]
 
     @property
     def target_temperature_low(self) -> float | None:
@@ -414,7 +435,7 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
         if not (self._has_temp_control and self._has_separate_targets):
             return None
 
-        return self.coordinator.data['zones'][self.zone_id]["temp_setpoint_heat"]
+        return self._zone["temp_setpoint_heat"]
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -422,6 +443,11 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
             _LOGGER.warning("Cannot set HVAC mode: Zone control is disabled")
             return
 
+        # A zone can report the stored mode while the unit is off, and
+        # CLIMATE_MODE is what turns the unit back on
+        if self._main["is_on"] and hvac_mode == self.hvac_mode:
+            return  # No change needed
+
         try:
             if hvac_mode == HVACMode.OFF:
                 await self.coordinator.set_zone_state(self.zone_id, False)
@@ -459,6 +485,19 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
                 target_low = kwargs.get('target_temp_low')
 
                 if target_high is not None or target_low is not None:
+                    # Only send the setpoints that actually change
+                    if target_high is not None and _same_setpoint(
+                        self._zone["temp_setpoint_cool"], target_high
+                    ):
+                        target_high = None
+                    if target_low is not None and _same_setpoint(
+                        self._zone["temp_setpoint_heat"], target_low
+                    ):
+                        target_low = None
+                    if target_high is None and target_low is None:
+                        return  # No change needed
+
+                    self.coordinator.mark_activity()
                     await self.coordinator.api.set_zone_temperature(
                         zone_index=zone_index,
                         target_cool=target_high,
@@ -469,6 +508,13 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
                     # Handle single target when separate targets are supported
                     temperature = kwargs.get(ATTR_TEMPERATURE)
                     if temperature is not None:
+                        if _same_setpoint(
+                            self._zone["temp_setpoint_cool"], temperature
+                        ) and _same_setpoint(
+                            self._zone["temp_setpoint_heat"], temperature
+                        ):
+                            return  # No change needed
+                        self.coordinator.mark_activity()
                         await self.coordinator.api.set_zone_temperature(
                             zone_index=zone_index,
                             target_cool=temperature,
@@ -482,7 +528,10 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
                     if not MIN_TEMP <= temperature <= MAX_TEMP:
                         _LOGGER.warning("Requested temperature %s outside valid range", temperature)
                         return
+                    if _same_setpoint(self._zone["temp_setpoint_heat"], temperature):
+                        return  # No change needed
 
+                    self.coordinator.mark_activity()
                     await self.coordinator.api.set_zone_temperature(
                         zone_index=zone_index,
                         temperature=temperature
@@ -525,30 +574,16 @@ class ActronZoneClimate(ActronEntityBase, ClimateEntity):
 
     def _actron_to_ha_hvac_mode(self, mode: str) -> HVACMode:
         """Convert Actron HVAC mode to HA HVAC mode."""
-        mode_map = {
-            "AUTO": HVACMode.AUTO,
-            "HEAT": HVACMode.HEAT,
-            "COOL": HVACMode.COOL,
-            "FAN": HVACMode.FAN_ONLY,
-            "OFF": HVACMode.OFF,
-        }
-        return mode_map.get(mode.upper(), HVACMode.OFF)
+        return REVERSE_HVAC_MODE_MAP.get(mode.upper(), HVACMode.OFF)
 
     def _ha_to_actron_hvac_mode(self, mode: HVACMode) -> str:
         """Convert HA HVAC mode to Actron HVAC mode."""
-        mode_map = {
-            HVACMode.AUTO: "AUTO",
-            HVACMode.HEAT: "HEAT",
-            HVACMode.COOL: "COOL",
-            HVACMode.FAN_ONLY: "FAN",
-            HVACMode.OFF: "OFF",
-        }
-        return mode_map.get(mode, "OFF")
+        return HVAC_MODE_MAP.get(mode, "OFF")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return zone specific attributes."""
-        zone_data = self.coordinator.data['zones'][self.zone_id]
+        zone_data = self._zone
         data = {
             "zone_name": zone_data['name'],
             "supports_temperature_control": self._has_temp_control,
@@ -15,12 +15,18 @@ CONF_ENABLE_ZONE_CONTROL: Final = "enable_zone_control"
 # Default values
 DEFAULT_REFRESH_INTERVAL: Final = 60  # seconds
 
+# Adaptive polling
+MAX_REFRESH_INTERVAL: Final = 300  # seconds, cap when the system is idle
+REFRESH_BACKOFF_FACTOR: Final = 1.5  # interval multiplier per unchanged poll
+ACTIVITY_HOLD_TIME: Final = 120  # seconds at the base interval after a command
+
 # API related constants
 API_URL: Final = "https://nimbus.actronair.com.au"
 API_TIMEOUT: Final = 30  # seconds
 MAX_RETRIES: Final = 3
 MAX_REQUESTS_PER_MINUTE: Final = 20
 MIN_FAN_MODE_INTERVAL: Final = 5  # seconds between fan mode changes
+STATUS_CACHE_TTL: Final = 1  # seconds a fetched status is shared with other callers
 
 # HVAC modes
 HVAC_MODE_OFF: Final = "OFF"
@@ -48,6 +54,7 @@ VALID_FAN_MODES = {"LOW", "MED", "HIGH", "AUTO"}
 # Temperature limits
 MIN_TEMP: Final = 10
 MAX_TEMP: Final = 30
+SETPOINT_TOLERANCE: Final = 0.05  # setpoints closer than this are treated as equal
 
 # Device attributes
 ATTR_INDOOR_TEMPERATURE: Final = "indoor_temperature"
@@ -4,6 +4,7 @@
 import asyncio
 from datetime import timedelta
 import datetime
+import time
 from typing import Any, Dict, Optional, Union
 import logging
 
@@ -15,6 +16,9 @@ from homeassistant.components.climate.const import HVACMode # type: ignore
 from .api import ActronApi, AuthenticationError, ApiError
 from .const import (
     DOMAIN,
+    ACTIVITY_HOLD_TIME,
+    MAX_REFRESH_INTERVAL,
+    REFRESH_BACKOFF_FACTOR,
     MAX_RETRIES,
     MAX_ZONES,
     MIN_FAN_MODE_INTERVAL,
@@ -26,6 +30,10 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields compared to decide whether polling can back off
+MAIN_CONTROL_KEYS = ("is_on", "mode", "fan_mode", "temp_setpoint_cool", "temp_setpoint_heat")
+ZONE_CONTROL_KEYS = ("is_enabled", "temp_setpoint_cool", "temp_setpoint_heat", "temp")
+
 class ActronDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching ActronAir Neo data."""
 
@@ -56,6 +64,16 @@ class ActronDataCoordinator(DataUpdateCoordinator):
         self.device_id = device_id
         self.enable_zone_control = enable_zone_control
         self.last_data = None
+        self._last_status = None
+
+        # Adaptive polling: back off while idle, poll at the base rate after commands
+        self._base_update_interval = timedelta(seconds=update_interval)
+        self._max_update_interval = max(
+            self._base_update_interval, timedelta(seconds=MAX_REFRESH_INTERVAL)
+        )
+        self._activity_until = 0.0
+        # Peripherals list and its zone index, rebuilt when the list changes
+        self._peripherals_by_zone: Dict[int, Dict[str, Any]] = {}
 
         # Fan mode control attributes
         self._continuous_fan = False
@@ -165,6 +183,43 @@ class ActronDataCoordinator(DataUpdateCoordinator):
         """Set continuous fan state."""
         self._continuous_fan = value
 
+    def mark_activity(self) -> None:
+        """Poll at the base interval for a while after a user command."""
+        self._activity_until = time.monotonic() + ACTIVITY_HOLD_TIME
+        self.update_interval = self._base_update_interval
+
+    @staticmethod
+    def _control_state(data: Dict[str, Any]) -> tuple:
+        """Project the fields that reflect control changes, ignoring telemetry."""
+        main = data.get("main") or {}
+        zones = data.get("zones") or {}
+        return (
+            tuple(main.get(key) for key in MAIN_CONTROL_KEYS),
+            tuple(
+                (zone_id, tuple(zone.get(key) for key in ZONE_CONTROL_KEYS))
+                for zone_id, zone in zones.items()
+            ),
+        )
+
+    def _adapt_update_interval(self, new_data: Dict[str, Any]) -> None:
+        """Lengthen the polling interval while the system state is unchanged."""
+        previous = self.last_data
+        unchanged = (
+            previous is not None
+            and self._control_state(new_data) == self._control_state(previous)
+        )
+
+        if unchanged and time.monotonic() >= self._activity_until:
+            interval = min(
+                self.update_interval * REFRESH_BACKOFF_FACTOR, self._max_update_interval
+            )
+        else:
+            interval = self._base_update_interval
+
+        if interval != self.update_interval:
+            _LOGGER.debug("Adjusting update interval to %s", interval)
+            self.update_interval = interval
+
     async def set_enable_zone_control(self, enable: bool):
         """Update the enable_zone_control status."""
         self.enable_zone_control = enable
@@ -179,7 +234,15 @@ class ActronDataCoordinator(DataUpdateCoordinator):
 
             _LOGGER.debug("Fetching data for device %s", self.device_id)
             status = await self.api.get_ac_status(self.device_id)
+            if status is self._last_status and self.last_data:
+                # The API reported no change, so the parsed data is still current
+                _LOGGER.debug("Status unchanged, reusing parsed data")
+                self._adapt_update_interval(self.last_data)
+                return self.last_data
+
             parsed_data = await self._parse_data(status)  # Add await here
+            self._adapt_update_interval(parsed_data)
+            self._last_status = status
             self.last_data = parsed_data
             _LOGGER.debug("Parsed data: %s", parsed_data)
             return parsed_data
@@ -283,7 +346,10 @@ class ActronDataCoordinator(DataUpdateCoordinator):
 
             # Parse zone data with enhanced capabilities and peripheral information
             remote_zone_info = last_known_state.get("RemoteZoneInfo", [])
-            peripherals = aircon_system.get("Peripherals", [])
+            peripherals_by_zone = self._index_peripherals(
+                aircon_system.get("Peripherals", [])
+            )
+            self._peripherals_by_zone = peripherals_by_zone
 
             for i, zone in enumerate(remote_zone_info):
                 if i < MAX_ZONES:
@@ -309,24 +375,23 @@ class ActronDataCoordinator(DataUpdateCoordinator):
                         }
 
                         # Find matching peripheral for battery info
-                        for peripheral in peripherals:
-                            if peripheral.get("ZoneAssignment", []) == [i + 1]:
-                                peripheral_data = {
-                                    "battery_level": peripheral.get("RemainingBatteryCapacity_pc"),
-                                    "signal_strength": peripheral.get("Signal_of3"),
-                                    "peripheral_type": peripheral.get("DeviceType"),
-                                    "last_connection": peripheral.get("LastConnectionTime"),
-                                    "connection_state": peripheral.get("ConnectionState"),
-                                }
-                                # Add peripheral data to zone_data
-                                zone_data.update(peripheral_data)
-
-                                # Add peripheral capabilities if present
-                                if peripheral.get("ControlCapabilities"):
-                                    zone_data["capabilities"].update({
-                                        "peripheral_capabilities": peripheral.get("ControlCapabilities")
-                                    })
-                                break
+                        peripheral = peripherals_by_zone.get(i + 1)
+                        if peripheral is not None:
+                            peripheral_data = {
+                                "battery_level": peripheral.get("RemainingBatteryCapacity_pc"),
+                                "signal_strength": peripheral.get("Signal_of3"),
+                                "peripheral_type": peripheral.get("DeviceType"),
+                                "last_connection": peripheral.get("LastConnectionTime"),
+                                "connection_state": peripheral.get("ConnectionState"),
+                            }
+                            # Add peripheral data to zone_data
+                            zone_data.update(peripheral_data)
+
+                            # Add peripheral capabilities if present
+                            if peripheral.get("ControlCapabilities"):
+                                zone_data["capabilities"].update({
+                                    "peripheral_capabilities": peripheral.get("ControlCapabilities")
+                                })
 
                         parsed_data["zones"][zone_id] = zone_data
 
@@ -457,19 +522,21 @@ class ActronDataCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Returning default modes due to error: %s", default_modes)
             return default_modes
 
+    @staticmethod
+    def _index_peripherals(peripherals: list[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """Map zone numbers to the first peripheral assigned solely to that zone."""
+        index: Dict[int, Dict[str, Any]] = {}
+        for peripheral in peripherals:
+            assignment = peripheral.get("ZoneAssignment", [])
+            if isinstance(assignment, list) and len(assignment) == 1:
+                index.setdefault(assignment[0], peripheral)
+        return index
+
     def get_zone_peripheral(self, zone_id: str) -> Union[Dict[str, Any], None]:
         """Get peripheral data for a specific zone."""
         try:
             zone_index = int(zone_id.split('_')[1]) - 1
-            peripherals = self.data.get("raw_data", {}).get(
-                "AirconSystem", {}
-            ).get("Peripherals", [])
-
-            for peripheral in peripherals:
-                if peripheral.get("ZoneAssignment", []) == [zone_index + 1]:
-                    return peripheral
-
-            return None
+            return self._peripherals_by_zone.get(zone_index + 1)
         except (KeyError, ValueError, IndexError) as ex:
             _LOGGER.error("Error getting peripheral data for zone %s: %s", zone_id, str(ex))
             return None
@@ -490,6 +557,7 @@ class ActronDataCoordinator(DataUpdateCoordinator):
                 command = self.api.create_command("OFF")
             else:
                 command = self.api.create_command("CLIMATE_MODE", mode=hvac_mode)
+            self.mark_activity()
             await self.api.send_command(self.device_id, command)
             await self.async_request_refresh()
         except Exception as err:
@@ -500,6 +568,7 @@ class ActronDataCoordinator(DataUpdateCoordinator):
         """Set temperature."""
         try:
             command = self.api.create_command("SET_TEMP", temp=temperature, is_cool=is_cooling)
+            self.mark_activity()
             await self.api.send_command(self.device_id, command)
             await self.async_request_refresh()
         except Exception as err:
@@ -551,14 +620,16 @@ class ActronDataCoordinator(DataUpdateCoordinator):
                         _LOGGER.debug("Sending fan mode command (attempt %d/%d): %s",
                                     attempt + 1, MAX_RETRIES, command)
 
+                        self.mark_activity()
                         await self.api.send_command(self.device_id, command)
 
                         # Update state tracking
                         self._last_fan_mode_change = datetime.datetime.now()
                         self._continuous_fan = continuous
 
-                        # Force immediate refresh
-                        await self.async_request_refresh()
+                        # Force immediate refresh, bypassing the debouncer so
+                        # the verification below sees the new state
+                        await self.async_refresh()
 
                         # Verify the change
                         new_mode = self.data["main"].get("fan_mode", "")
@@ -639,6 +710,7 @@ class ActronDataCoordinator(DataUpdateCoordinator):
                                         zone=zone_index,
                                         temp=temperature,
                                         temp_key=temp_key)
+            self.mark_activity()
             await self.api.send_command(self.device_id, command)
             _LOGGER.info("Successfully set zone %s temperature to %s", zone_id, temperature)
             await self.async_request_refresh()
@@ -666,6 +738,7 @@ class ActronDataCoordinator(DataUpdateCoordinator):
             if 0 <= zone_index < len(modified_statuses):
                 modified_statuses[zone_index] = enable
                 command = self.api.create_command("SET_ZONE_STATE", zones=modified_statuses)
+                self.mark_activity()
                 await self.api.send_command(self.device_id, command)
                 await self.async_request_refresh()
             else:
@@ -679,6 +752,7 @@ class ActronDataCoordinator(DataUpdateCoordinator):
         """Set climate mode for all zones."""
         try:
             command = self.api.create_command("CLIMATE_MODE", mode=mode)
+            self.mark_activity()
             await self.api.send_command(self.device_id, command)
             await self.async_request_refresh()
         except Exception as err:
@@ -688,6 +762,7 @@ class ActronDataCoordinator(DataUpdateCoordinator):
     async def set_away_mode(self, state: bool) -> None:
         """Set away mode."""
         try:
+            self.mark_activity()
             await self.api.set_away_mode(state)
             await self.async_request_refresh()
         except Exception as err:
@@ -697,6 +772,7 @@ class ActronDataCoordinator(DataUpdateCoordinator):
     async def set_quiet_mode(self, state: bool) -> None:
         """Set quiet mode."""
         try:
+            self.mark_activity()
             await self.api.set_quiet_mode(state)
             await self.async_request_refresh()
         except Exception as err:
@@ -66,17 +66,7 @@ class ActronSensorBase(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{coordinator.device_id}_{unique_id}"
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def device_info(self):
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.device_id)},
-            "name": "ActronAir Neo",
-            "manufacturer": "ActronAir",
-            "model": self.coordinator.data["main"]["model"],
-            "sw_version": self.coordinator.data["main"]["firmware_version"],
-        }
+        self._attr_device_info = ActronEntityBase.build_device_info(coordinator)
 
 class ActronMainSensor(ActronEntityBase, SensorEntity):
     """Main temperature sensor."""
@@ -103,6 +93,15 @@ class ActronMainSensor(ActronEntityBase, SensorEntity):
 class ActronZoneSensor(ActronEntityBase, SensorEntity):
     """Zone temperature sensor."""
 
+    # Peripheral metadata changes on every sensor check-in but has no history value
+    _unrecorded_attributes = frozenset({
+        ATTR_ZONE_NAME,
+        ATTR_ZONE_TYPE,
+        ATTR_SIGNAL_STRENGTH,
+        ATTR_LAST_UPDATED,
+        "connection_state",
+    })
+
     def __init__(self, coordinator: ActronDataCoordinator, zone_id: str) -> None:
         """Initialize the zone sensor."""
         zone_name = coordinator.data['zones'][zone_id]['name']
@@ -46,17 +46,7 @@ class ActronBaseSwitch(CoordinatorEntity, SwitchEntity):
         self.switch_type = switch_type
         self._attr_name = f"ActronAir Neo {switch_type.replace('_', ' ').title()}"
         self._attr_unique_id = f"{coordinator.device_id}_{switch_type}"
-
-    @property
-    def device_info(self):
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.device_id)},
-            "name": "ActronAir Neo",
-            "manufacturer": "ActronAir",
-            "model": self.coordinator.data["main"]["model"],
-            "sw_version": self.coordinator.data["main"]["firmware_version"],
-        }
+        self._attr_device_info = ActronEntityBase.build_device_info(coordinator)
 
 class ActronAwayModeSwitch(ActronEntityBase, SwitchEntity):
     """Away mode switch."""
@@ -227,14 +217,3 @@ class ActronZoneSwitch(ActronEntityBase, SwitchEntity):
     async def async_turn_off(self) -> None:
         """Turn the zone off."""
         await self.coordinator.set_zone_state(self.zone_index, False)
-
-    @property
-    def device_info(self):
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.device_id)},
-            "name": "ActronAir Neo",
-            "manufacturer": "ActronAir",
-            "model": self.coordinator.data["main"]["model"],
-            "sw_version": self.coordinator.data["main"]["firmware_version"],
-        }